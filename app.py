@@ -1,19 +1,24 @@
 import os
+import functools
+import orjson
 import pandas as pd
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_jwt_extended import JWTManager
+from sqlalchemy import event
 from werkzeug.exceptions import HTTPException
 
 # My imports
 from auth import router as auth_router
-from extensions import db, jwt
-from data_prep import load_weather_data, CROP_THRESHOLDS
+from extensions import db, jwt, OrjsonProvider, set_sqlite_pragmas
+from data_prep import load_weather_data, CROP_THRESHOLDS, CROP_LIST, CROP_BY_NAME
+from recommendations import get_recommendations, get_crop_suitability
 
 
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.register_blueprint(auth_router)
 
     # -- JWT config --
@@ -29,8 +34,11 @@ def create_app():
     jwt.init_app(app)
 
     with app.app_context():
+        event.listen(db.engine, "connect", set_sqlite_pragmas)
         # one-time setup, e.g. create tables
         db.create_all()
+        # Don't leave a pooled SQLite connection for forked workers to inherit
+        db.engine.dispose()
 
     return app
 
@@ -56,113 +64,75 @@ def handle_exception(e):
 
 weather = load_weather_data("weather_data")
 
+# Each location's weather, split out once so requests never rescan the frame
+LOCAL_WEATHER: dict[str, pd.DataFrame] = {
+    location: local_weather
+    for location, local_weather in weather.groupby("name", observed=True, sort=False)
+}
 
-def get_recommendations(weather_data, crop):
-    """
-    Generates agricultural recommendations based on weather data for a given crop.
+# First year on record for each location
+LOCATION_YEARS: dict[str, int] = {
+    location: int(local_weather["year"].iat[0])
+    for location, local_weather in LOCAL_WEATHER.items()
+}
 
-    Args:
-        weather_data (pd.DataFrame): Weather data (temp, precip, humidity, solarradiation)
-                                                for the specified period. This will now typically be
-                                                a wider rolling window (e.g., 21 days).
-        crop (str): The name of the crop for which to get recommendations (e.g., "corn", "wheat").
 
-    Returns:
-        dict: A dictionary containing recommendations or an error message.
-    """
-    if crop not in CROP_THRESHOLDS:
-        return {"msg": f"Unsupported crop '{crop}'"}
-
-    if not isinstance(weather_data, pd.DataFrame):
-        try:
-            weather_data = pd.DataFrame(weather_data)
-        except Exception as e:
-            return {"msg": f"Invalid weather data format: {e}"}
-
-    required_cols = ['temp', 'precip', 'humidity', 'solarradiation']
-    if not all(col in weather_data.columns for col in required_cols):
-        return {"msg": f"Missing required weather data columns. Need: {', '.join(required_cols)}"}
-
-    avg_temp = weather_data['temp'].mean()
-    avg_precip = weather_data['precip'].mean()
-    avg_humidity = weather_data['humidity'].mean()
-    avg_solar = weather_data['solarradiation'].mean()
-
-    threshold = CROP_THRESHOLDS[crop]
-    max_temp = threshold["max_temp"]
-    min_precip = threshold["min_precip"]
-    max_precip = threshold["max_precip"]
-    max_humidity = threshold["max_humidity"]
-
-    recommendations = []
-    recent_precip = weather_data['precip'].iloc[-1] if not weather_data['precip'].empty else 0
-    is_currently_raining = recent_precip > 0.5
-
-    # Planting Conditions Recommendations
-    if avg_precip > max_precip:
-        recommendations.append(
-            f"High avg rain. Good conditions for planting {crop}.")
-
-    # Check for ideal planting conditions
-    elif avg_temp >= max_temp and min_precip <= avg_precip <= max_precip:
-        recommendations.append(f"Good conditions for planting {crop}.")
-
-    # Check for temperature too low
-    elif avg_temp < max_temp:
-        recommendations.append(f"Temp too low. Wait for warmer conditions.")
-
-    # Check for rainfall too low, with a nuance for current rain
-    elif avg_precip < min_precip:
-        if is_currently_raining:
-            recommendations.append(
-                f"Avg rain low, but currently raining. Monitor closely.")
-        else:
-            recommendations.append(
-                f"Rainfall too low. Irrigation may be needed.")
+def to_json_bytes(obj) -> bytes:
+    """Serializes obj straight to UTF-8 bytes with orjson (NumPy scalars included)."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
 
-    # Irrigation Recommendations
-    # Suggest irrigation if average is very low AND it's not currently raining significantly
-    if avg_precip < (0.5 * min_precip) and not is_currently_raining:
-        recommendations.append(f"Very low avg rain. Apply irrigation.")
 
-    elif avg_precip < (0.5 * min_precip) and is_currently_raining:
-        recommendations.append(
-            f"Very low avg rain, but currently raining. Monitor water levels.")
+def json_response(body: bytes, status: int = 200):
+    """Wraps prebuilt JSON bytes in a Response."""
+    return Response(body, status=status, mimetype="application/json")
 
-    # Waterlogging Warning
-    if avg_precip > max_precip * 1.2:
-        recommendations.append(
-            f"Excessive avg rain. High waterlogging risk. Ensure drainage.")
 
-    # Flag potential waterlogging if recent rain is high, even if average isn't extremely high
-    elif recent_precip > max_precip * 0.5:
-        recommendations.append(
-            f"High recent rain. Potential waterlogging risk. Monitor.")
+# How long clients and proxies may reuse a cached response, in seconds
+CACHE_MAX_AGE = 3600
 
-    # Favorable conditions for fertilizer application, avoiding waterlogged soil and active rain
-    if 10 <= avg_temp <= 29 and avg_precip < 10 and not is_currently_raining and recent_precip < 5:
-        recommendations.append("Favorable for fertilizer application.")
 
-    # If conditions are otherwise favorable but it's currently raining
-    elif 10 <= avg_temp <= 29 and avg_precip < 10 and is_currently_raining:
-        recommendations.append(
-            "Favorable for fertilizer, but currently raining. Apply after rain subsides.")
+def cached_route(view=None, *, max_age=CACHE_MAX_AGE):
+    """
+    Marks an endpoint whose response depends only on its URL and the static
+    weather data. Successful responses get Cache-Control and an ETag derived
+    from the body, and clients sending a matching If-None-Match get a bodiless
+    304 Not Modified. The ETag hashes the body rather than the URL because
+    some endpoints (e.g. /weather/today) also depend on the current date.
+
+    max_age is in seconds, or a callable returning seconds for endpoints
+    whose response changes with the clock: @cached_route(max_age=...).
+    """
+    if view is None:
+        return functools.partial(cached_route, max_age=max_age)
 
-    # Harvesting Conditions Recommendations
-    if avg_precip <= min_precip and avg_humidity <= max_humidity:
-        recommendations.append(f"Good for harvesting {crop}.")
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        # Taken before the view runs, so a response built just before a date
+        # change can't get the next day's full lifetime
+        seconds = max_age() if callable(max_age) else max_age
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            response.cache_control.public = True
+            response.cache_control.max_age = seconds
+            response.add_etag()
+            response = response.make_conditional(request)
+        return response
 
-    if not recommendations:
-        recommendations.append(
-            "No specific recommendations for current conditions.")
+    return wrapper
 
-    return recommendations
+
+def seconds_until_midnight() -> int:
+    """Seconds left in the current (server local) day."""
+    now = datetime.now()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    return max(int((midnight - now).total_seconds()), 0)
 
 
 ROLLING_WINDOW_DAYS = 21
 
 
 @app.route("/recommendations/<string:location>/<int:month>/<int:day>", methods=["GET"])
+@cached_route
 def get_weekly_recommendations(location, month, day):
     """
     Provides agricultural recommendations for a specific week, using a rolling window
@@ -184,131 +154,133 @@ def get_weekly_recommendations(location, month, day):
     if crop not in CROP_THRESHOLDS:
         return jsonify({"msg": f"Unsupported crop '{crop}'"}), 400
 
-    # Filter weather data based on a location
-    local_weather = weather[weather["name"] == location]
-    if local_weather.empty:
+    if location not in LOCATION_YEARS:
         return jsonify({"msg": f"No weather data found for location {location}"})
 
     try:
-        year = local_weather.index[0].year
-        query_date = datetime(year, month, day)
+        query_date = datetime(LOCATION_YEARS[location], month, day)
     except ValueError:
         return jsonify({"msg": "Invalid date."}), 400
 
     week_end_for_query = query_date + \
         timedelta(days=(6 - query_date.weekday()))
-    rolling_window_start = week_end_for_query - \
+
+    return json_response(*WEEKLY_RECOMMENDATIONS[(location, week_end_for_query, crop)])
+
+
+def weekly_recommendations_json(location, week_end, crop) -> tuple[bytes, int]:
+    """
+    Computes the body of GET /recommendations/<location>/<month>/<day> for the
+    week ending on week_end (a Sunday).
+
+    Returns:
+        tuple[bytes, int]: The serialized JSON body and its HTTP status code.
+    """
+    local_weather = LOCAL_WEATHER[location]
+
+    rolling_window_start = week_end - \
         timedelta(days=ROLLING_WINDOW_DAYS - 1)
 
-    # Filter local_weather data for this calculated rolling window
-    rolling_weather = local_weather[
-        (local_weather.index.date >= rolling_window_start.date()) &
-        (local_weather.index.date <= week_end_for_query.date())
-    ]
+    # Slice local_weather data for this calculated rolling window
+    # (weather is sorted by date, so .loc uses a binary search)
+    rolling_weather = local_weather.loc[rolling_window_start:week_end]
 
     if rolling_weather.empty:
-        return jsonify({"msg": "No weather data available for the specified rolling period."}), 404
+        return to_json_bytes({"msg": "No weather data available for the specified rolling period."}), 404
 
     recommendations = get_recommendations(rolling_weather, crop)
 
-    return jsonify({
+    return to_json_bytes({
         "crop": crop,
-        "week_start": (query_date - timedelta(days=query_date.weekday())).strftime("%Y-%m-%d"),
-        "week_end": week_end_for_query.strftime("%Y-%m-%d"),
+        "week_start": (week_end - timedelta(days=6)).strftime("%Y-%m-%d"),
+        "week_end": week_end.strftime("%Y-%m-%d"),
         "recommendations": recommendations
-    })
+    }), 200
 
 
-def is_suitable_crop(weather_data, crop_thresholds):
-    """
-    Checks whether a crop is suitable to grow in certain weather conditions.
-    Returns True if 75% or more parameters are met.
-    """
-    # Evaluate each season for crop suitability
-    suitable_seasons = []
-
-    for _, row in weather_data.iterrows():
-        score = 0
-        total = 4  # number of parameters being checked
-
-        season_temp = row["temp"]
-        season_precip = row["precip"]
-        season_humidity = row["humidity"]
-        season_solarradiation = row["solarradiation"]
-
-        if crop_thresholds["min_temp"] <= season_temp <= crop_thresholds["max_temp"]:
-            score += 1
-        if crop_thresholds["min_precip"] <= season_precip <= crop_thresholds["max_precip"]:
-            score += 1
-        if crop_thresholds["min_humidity"] <= season_humidity <= crop_thresholds["max_humidity"]:
-            score += 1
-        if crop_thresholds["min_solarradiation"] <= season_solarradiation <= crop_thresholds["max_solarradiation"]:
-            score += 1
-
-        if score / total >= 0.75:
-            suitable_seasons.append({
-                "year": int(row["year"]),
-                "season": row["season"],
-                "score": score / total,
-                "avg_temp": round(row["temp"], 1),
-                "total_rain": round(row["precip"], 1),
-                "avg_humidity": round(row["humidity"], 1),
-                "avg_solarradiation": round(row["solarradiation"], 1)
-            })
-
-    return len(suitable_seasons) > 0
+# -- Precomputed responses --
+# The weather data is static, so every recommendation response is built once
+# at startup. Queries resolve against the first year on record for a location,
+# and every day of a week shares the same rolling window, so the table is
+# keyed on (location, week_end, crop).
+
+
+def get_week_ends(year):
+    """Returns the Sunday ending each week that has a day in the given year."""
+    first_day = datetime(year, 1, 1)
+    week_end = first_day + timedelta(days=(6 - first_day.weekday()))
+    week_ends = []
+    while week_end - timedelta(days=6) <= datetime(year, 12, 31):
+        week_ends.append(week_end)
+        week_end += timedelta(days=7)
+    return week_ends
+
+
+WEEKLY_RECOMMENDATIONS: dict[tuple[str, datetime, str], tuple[bytes, int]] = {
+    (location, week_end, crop): weekly_recommendations_json(location, week_end, crop)
+    for location, year in LOCATION_YEARS.items()
+    for week_end in get_week_ends(year)
+    for crop in CROP_THRESHOLDS
+}
+
+
+# Static responses, encoded once. Views wrap the bytes in a new Response per
+# request because cached_route may turn a response into a 304 in place.
+ALL_CROPS_JSON = to_json_bytes(CROP_LIST)
+ALL_LOCATIONS_JSON = to_json_bytes(list(LOCAL_WEATHER))
+CROP_THRESHOLDS_JSON: dict[str, bytes] = {
+    crop: to_json_bytes(threshold) for crop, threshold in CROP_BY_NAME.items()
+}
 
 # endpoint: GET /all-crops
 
 
 @app.route("/all-crops", methods=["GET"])
+@cached_route
 def get_all_crops():
-    crops: list[dict[str, dict]] = []
-
-    for crop, threshold in CROP_THRESHOLDS.items():
-        threshold["name"] = crop
-        crops.append(threshold)
-
-    return jsonify(crops)
+    return json_response(ALL_CROPS_JSON)
 
 # endpoint: GET /all-locations
 
 
 @app.route("/all-locations", methods=["GET"])
+@cached_route
 def get_all_locations():
-    locations = weather["name"].unique().tolist()
-    return jsonify(locations)
+    return json_response(ALL_LOCATIONS_JSON)
 
 # endpoint: GET /crop_thresholds/<crop>
 
 
 @app.route("/crop_thresholds/<string:crop>", methods=["GET"])
+@cached_route
 def get_crop_thresholds(crop):
     crop = crop.lower()
     if crop not in CROP_THRESHOLDS:
         return jsonify({"msg": f"Unsupported crop {crop}"}), 400
 
-    threshold = CROP_THRESHOLDS[crop]
-    threshold["name"] = crop
+    return json_response(CROP_THRESHOLDS_JSON[crop])
 
-    return jsonify(threshold)
+# Suitability of every crop per location, scored once against the full history
+CROP_SUITABILITY: dict[str, dict[str, bool]] = {
+    location: get_crop_suitability(local_weather)
+    for location, local_weather in LOCAL_WEATHER.items()
+}
 
 # endpoint: GET /suitable_crops/<location>
 
 
 @app.route("/suitable_crops/<string:location>", methods=["GET"])
+@cached_route
 def get_suitable_crops(location):
-    # Filter weather data based on a location
-    local_weather = weather[weather["name"] == location]
-    if local_weather.empty:
+    if location not in CROP_SUITABILITY:
         return jsonify({"msg": f"No weather data found for location {location}"})
 
     suitable_crops: list[dict[str, dict]] = []
+    crop_suitability = CROP_SUITABILITY[location]
 
-    for crop, threshold in CROP_THRESHOLDS.items():
-        if is_suitable_crop(local_weather, threshold):
-            threshold["name"] = crop
-            suitable_crops.append(threshold)
+    for crop in CROP_THRESHOLDS:
+        if crop_suitability[crop]:
+            suitable_crops.append(CROP_BY_NAME[crop])
         else:
             print(f"Crop {crop} not suitable to grow in {location}")
 
@@ -317,151 +289,151 @@ def get_suitable_crops(location):
 
     return jsonify(suitable_crops)
 
+
+def most_frequent(values, default="Unknown"):
+    """
+    Returns the most frequent value in a Series, or default if it has none.
+    Unlike mode() this never sorts the values: value_counts() hash-counts
+    them (bincounts the codes of a categorical) and, with sort=False, keeps
+    the category order, so ties still resolve to the smallest label.
+    """
+    counts = values.value_counts(sort=False)
+    if counts.empty or counts.max() == 0:
+        return default
+    return counts.idxmax()
+
+
+def aggregate_weather(data, by, columns, sort=True):
+    """
+    Averages the given numeric columns (rounded to 2 d.p.) and picks the most
+    frequent conditions for each group of data[by], in a single groupby.
+
+    Returns:
+        pd.DataFrame: One row per group with the averaged columns plus conditions.
+    """
+    grouped = data.groupby(by, observed=True, sort=sort)
+    averages = grouped[columns].mean().astype("float64").round(2)
+    averages["conditions"] = grouped["conditions"].agg(most_frequent)
+    return averages
+
+
+# Columns averaged by the multi-day forecast endpoints
+FORECAST_COLUMNS = ["tempmax", "tempmin", "temp",
+                    "humidity", "precip", "windspeed"]
+
+# Day-of-year climatology per location: the average of every FORECAST_COLUMN
+# and the most frequent conditions for each "MM-DD" across all years on record
+CLIMO_DAY: dict[str, pd.DataFrame] = {
+    location: aggregate_weather(local_weather, "month_day", FORECAST_COLUMNS)
+    for location, local_weather in LOCAL_WEATHER.items()
+}
+
 # endpoint: GET /weather/today
 
 
 @app.route("/weather/today/<string:location>", methods=["GET"])
+@cached_route(max_age=seconds_until_midnight)
 def get_todays_weather(location):
-    # Filter weather data based on a location
-    local_weather = weather[weather["name"] == location]
-    if local_weather.empty:
-        return jsonify({"msg": f"No weather data found for location {location}"})
-
-    local_weather["month_day"] = local_weather.index.strftime("%m-%d")
-    local_weather["year"] = local_weather.index.year
-
     today = datetime.now()
     month_day = today.strftime("%m-%d")
+    return json_response(*todays_weather_json(location, month_day))
 
-    # Filter the DataFrame for the matching day across all years
-    data = local_weather[local_weather["month_day"] == month_day]
+
+@functools.lru_cache(maxsize=128)
+def todays_weather_json(location, month_day) -> tuple[bytes, int]:
+    climatology = CLIMO_DAY.get(location)
+    if climatology is None:
+        return to_json_bytes({"msg": f"No weather data found for location {location}"}), 200
 
     forecast_columns = ["temp", "humidity", "precip", "conditions"]
     forecast = {}
 
-    if not data.empty:
+    # Averages for the matching day across all years
+    if month_day in climatology.index:
         forecast_date = datetime.strptime(f"2025-{month_day}", "%Y-%m-%d")
         forecast["date"] = forecast_date.isoformat()
+        forecast.update(climatology.loc[month_day, forecast_columns].to_dict())
 
-        for col in forecast_columns:
-            if col == "conditions":
-                mode_values = data[col].mode()
-                forecast[col] = mode_values.iloc[0] if not mode_values.empty else "Unknown"
-            else:
-                forecast[col] = round(data[col].mean(), 2)
-
-    return jsonify(forecast)
+    return to_json_bytes(forecast), 200
 
 # endpoint: GET /weather/<month>/<day>
 
 
 @app.route("/weather/<string:location>/<int:month>/<int:day>", methods=["GET"])
+@cached_route
 def get_this_weeks_weather(location, month, day):
-    # Filter weather data based on a location
-    local_weather = weather[weather["name"] == location]
-    if local_weather.empty:
+    if location not in LOCATION_YEARS:
         return jsonify({"msg": f"No weather data found for location {location}"})
 
-    local_weather.loc[:, "month_day"] = local_weather.index.strftime("%m-%d")
-    local_weather.loc[:, "year"] = local_weather.index.year
-
     # Define forecast target dates
     this_year = datetime.today().date().year
     today = datetime(this_year, month, day)
-    upcoming_days = []
+    upcoming_days = [today + timedelta(days=offset) for offset in range(1, 8)]
 
-    for offset in range(1, 8):
-        next_day = today + timedelta(days=offset)
-        formatted_day = next_day.strftime("%m-%d")
-        upcoming_days.append(formatted_day)
+    # Gather the precomputed averages for all seven days in one reindex;
+    # days missing from the climatology come back as all-NaN rows and are dropped
+    month_days = [next_day.strftime("%m-%d") for next_day in upcoming_days]
+    forecast_df = CLIMO_DAY[location].reindex(month_days)
+    dates = [forecast_date(next_day.month, next_day.day) for next_day in upcoming_days]
+    forecast_df.insert(0, "date", [date.isoformat(timespec="milliseconds") if date else None
+                                   for date in dates])
+    forecast = forecast_df.dropna(subset=["conditions"]).to_dict(orient="records")
 
-    forecast_columns = ["tempmax", "tempmin", "temp",
-                        "humidity", "precip", "windspeed", "conditions"]
-    forecast = []
-
-    # Calculate avg local_weather conditions over the years
-    for month_day in upcoming_days:
-        data = local_weather[local_weather["month_day"] == month_day]
-
-        if not data.empty:
-            avg = {
-                "date": f"2025-{month_day}",
-            }
-            for col in forecast_columns:
-                if col == "conditions":
-                    # Most frequent condition
-                    mode_values = data[col].mode()
-                    if not mode_values.empty:
-                        avg[col] = mode_values.iloc[0]
-                    else:
-                        avg[col] = "Unknown"
-                else:
-                    avg[col] = round(data[col].mean(), 2)
-            forecast.append(avg)
-
-    forecast_df = pd.DataFrame(forecast)
-
-    # Ensure 'date' column is datetime (in case it's a string)
-    forecast_df['date'] = pd.to_datetime(forecast_df['date'])
-
-    forecast_json = forecast_df.to_json(orient="records", date_format="iso")
-    return forecast_json
+    return json_response(to_json_bytes(forecast))
 
 # endpoint: GET /weather/<month>
 
 
 @app.route("/weather/<string:location>/<int:month>", methods=["GET"])
+@cached_route
 def get_this_months_weather(location, month):
     if month < 1 or month > 12:
         return jsonify({"msg": "Invalid month. Use 1-12."}), 400
 
-    # Filter weather data based on a location
-    local_weather = weather[weather["name"] == location]
-    if local_weather.empty:
+    if location not in LOCATION_YEARS:
         return jsonify({"msg": f"No weather data found for location {location}"})
 
-    # Extract month-day and year from index
-    local_weather["month_day"] = local_weather.index.strftime("%m-%d")
-    local_weather["year"] = local_weather.index.year
-    local_weather["month"] = local_weather.index.month
-    local_weather["day"] = local_weather.index.day
+    return json_response(*MONTHLY_WEATHER[(location, month)])
+
+
+def monthly_weather_json(location, month) -> tuple[bytes, int]:
+    local_weather = LOCAL_WEATHER[location]
 
-    month_data = local_weather[local_weather["month"] == month]
+    month_data = local_weather[local_weather["month"].values == month]
 
     if month_data.empty:
-        return jsonify({"msg": "No weather data for this month"}), 404
+        return to_json_bytes({"msg": "No weather data for this month"}), 404
+
+    # Group by day of the month and aggregate every column in one pass
+    averages = aggregate_weather(month_data, "day", FORECAST_COLUMNS)
 
-    forecast_columns = ["tempmax", "tempmin", "temp",
-                        "humidity", "precip", "windspeed", "conditions"]
     forecast = []
+    for day, avg in zip(averages.index, averages.to_dict(orient="records")):
+        date = forecast_date(month, int(day))
+        forecast.append({
+            "date": date.isoformat(timespec="milliseconds") if date else None,
+            **avg,
+            "day": date.strftime("%A") if date else None,
+        })
+
+    return to_json_bytes(forecast), 200
+
+
+def forecast_date(month, day):
+    """Returns month/day in 2025, or None if the day does not exist that year (e.g. 02-29)."""
+    try:
+        return datetime(2025, month, day)
+    except ValueError:
+        return None
+
 
-    # Group by day of the month to aggregate per date
-    grouped = month_data.groupby("day")
-
-    for day, group in grouped:
-        month_day_str = f"{month:02d}-{day:02d}"
-        avg = {
-            "date": f"2025-{month_day_str}",
-        }
-        for col in forecast_columns:
-            if col == "conditions":
-                # Most frequent conditions
-                mode_values = group[col].mode()
-                if not mode_values.empty:
-                    avg[col] = mode_values.iloc[0]
-                else:
-                    avg[col] = "Unknown"
-            else:
-                avg[col] = round(group[col].mean(), 2)
-        forecast.append(avg)
-
-    forecast_df = pd.DataFrame(forecast)
-    forecast_df['date'] = pd.to_datetime(forecast_df['date'], errors='coerce')
-    forecast_df['day'] = forecast_df['date'].dt.day_name()
-
-    forecast_json = forecast_df.to_json(orient="records", date_format="iso")
-    return forecast_json
+MONTHLY_WEATHER: dict[tuple[str, int], tuple[bytes, int]] = {
+    (location, month): monthly_weather_json(location, month)
+    for location in LOCATION_YEARS
+    for month in range(1, 13)
+}
 
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Werkzeug development server; serve wsgi:app with gunicorn in production
+    app.run(debug=os.getenv("FLASK_ENV") == "development")
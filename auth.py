@@ -1,16 +1,19 @@
-import threading
 import datetime
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import (
     create_access_token, jwt_required, get_jwt_identity,
 )
+from sqlalchemy.orm import joinedload
 
 # My imports
-from extensions import db, send_password_reset_email
+from extensions import db, send_password_reset_email, MAIL_EXECUTOR
 from models import User, OTP
 
 router = Blueprint("auth", __name__, url_prefix="/auth")
 
+# Lifetime of access tokens issued on login
+TOKEN_EXPIRES = datetime.timedelta(hours=48)
+
 
 # --- ROUTES ---
 @router.route("/register", methods=["POST"])
@@ -51,10 +54,13 @@ def login():
     if not user or not user.check_password(password):
         return jsonify({"msg": "Invalid username or password"}), 401
 
+    if db.session.is_modified(user):
+        # check_password upgraded a legacy password hash
+        db.session.commit()
+
     # Create JWT with expiry
-    expires = datetime.timedelta(hours=48)
     access_token = create_access_token(
-        identity=f"{user.id}", expires_delta=expires)
+        identity=f"{user.id}", expires_delta=TOKEN_EXPIRES)
     return jsonify({
         "msg": "Logged in successfully",
         "access_token": access_token
@@ -83,10 +89,7 @@ def forgot_password():
     db.session.commit()
 
     # Send reset token to users email
-    threading.Thread(
-        target=send_password_reset_email,
-        args=(user.username, email, new_otp.otp,)
-    ).start()
+    MAIL_EXECUTOR.submit(send_password_reset_email, user.username, email, new_otp.otp)
 
     return jsonify({
         "msg": "Password reset OTP sent to your email"
@@ -104,8 +107,8 @@ def reset_password():
     if new_password != confirm_new_password:
         return jsonify({"msg": "New Password and Confirm New Password do NOT match"}), 400
 
-    # Find valid OTP
-    otp_record: OTP | None = OTP.query.filter(
+    # Find valid OTP, loading its user in the same query
+    otp_record: OTP | None = OTP.query.options(joinedload(OTP.user)).filter(
         OTP.email == email,
         OTP.otp == otp,
         OTP.expiry_time > datetime.datetime.now(),
@@ -115,8 +118,7 @@ def reset_password():
     if otp_record is None:
         return jsonify({"msg": "Invalid or expired OTP"}), 400
 
-    # Find user
-    user = User.query.filter_by(email=email).first()
+    user = otp_record.user
     if user is None:
         return jsonify({"msg": "No account found with this email"}), 400
 
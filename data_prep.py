@@ -1,6 +1,48 @@
+import numpy as np
 import pandas as pd
+import functools
 import glob
+import hashlib
 import os
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+
+# Processed weather data is cached here (inside the data folder) as Parquet
+WEATHER_CACHE_FILE = "weather_cache.parquet"
+# Parquet metadata entry holding the fingerprint of the files the cache was built from
+WEATHER_CACHE_KEY = b"weather_cache_key"
+
+# float32 is ample precision for weather readings and halves memory traffic
+WEATHER_DTYPES: dict[str, str] = {
+    "temp": "float32",
+    "tempmax": "float32",
+    "tempmin": "float32",
+    "humidity": "float32",
+    "precip": "float32",
+    "solarradiation": "float32",
+    "cloudcover": "float32",
+    "windspeed": "float32",
+}
+
+# Upper bound on CSV files parsed concurrently
+MAX_READ_WORKERS = 8
+
+# The only CSV columns the app uses; "conditions" is re-derived on load
+WEATHER_COLUMNS: list[str] = ["datetime", "name", *WEATHER_DTYPES]
+
+# Categories of the derived "conditions" column
+WEATHER_CONDITIONS: list[str] = ["clear", "overcast", "partially_cloudy", "rain", "sunny"]
+
+# Season of each month, indexed by month number (index 0 is unused)
+SEASON_BY_MONTH = np.array([
+    "",
+    "JFM", "JFM", "JFM",    # January, February, March season
+    "AMJ", "AMJ", "AMJ",    # April, May, June season
+    "JAS", "JAS", "JAS",    # July, August, September season
+    "OND", "OND", "OND",    # October, November, December season
+], dtype=object)
+SEASONS: list[str] = ["JFM", "AMJ", "JAS", "OND"]
 
 CROP_THRESHOLDS: dict[str, dict] = {
     "tea": {
@@ -93,58 +135,167 @@ CROP_THRESHOLDS: dict[str, dict] = {
     }
 }
 
+# Crop thresholds as returned by the API, with each crop's name included.
+# Built once so endpoints never mutate the shared CROP_THRESHOLDS dicts.
+CROP_LIST: list[dict] = [
+    {**threshold, "name": crop} for crop, threshold in CROP_THRESHOLDS.items()
+]
+CROP_BY_NAME: dict[str, dict] = {crop["name"]: crop for crop in CROP_LIST}
+
+@functools.lru_cache(maxsize=None)
 def load_weather_data(folder_path) -> pd.DataFrame:
+    """
+    Loads and prepares the weather data in folder_path. The fully processed
+    DataFrame is cached to Parquet and memoized per folder, so callers share
+    one frame and must treat it as read-only.
+    """
     print("Loading weather data...")
 
-    csv_files = glob.glob(os.path.join(folder_path, "*.csv"))
+    csv_files = sorted(glob.glob(os.path.join(folder_path, "*.csv")))
     if not csv_files:
         print(f"No CSV files found in {folder_path}. Returning an empty DataFrame.")
         return pd.DataFrame()
 
-    df_list = []
-    for file in csv_files:
-        print(f"Loading file {file}")
-        df_list.append(pd.read_csv(file, index_col="datetime"))
+    # The cache holds processed data, so it also goes stale when this module changes
+    cache_path = os.path.join(folder_path, WEATHER_CACHE_FILE)
+    cache_key = weather_cache_key(csv_files + [__file__])
+    weather = read_weather_cache(cache_path, cache_key)
+    if weather is not None:
+        return weather
+
+    weather = prepare_weather_data(csv_files)
+    write_weather_cache(weather, cache_path, cache_key)
+    return weather
+
+def prepare_weather_data(csv_files) -> pd.DataFrame:
+    # pandas' C parser releases the GIL, so files are parsed in parallel
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(csv_files))) as executor:
+        df_list = list(executor.map(read_weather_csv, csv_files))
 
     weather = pd.concat(df_list, axis=0)
-    weather.index = pd.to_datetime(weather.index)
+
+    # Sorted index lets time-window queries slice via binary search
+    weather = weather.sort_index(kind="stable")
+    weather = add_date_columns(weather)
 
     # Group weather conditions
-    # Clean conditions column
-    weather["conditions"] = weather.apply(group_weather_conditions, axis=1)
-    weather = clean_string_column(weather.copy(), "conditions")
-    weather = clean_string_column(weather.copy(), "name")
+    # (labels are already lowercase/underscored, so only "name" needs cleaning)
+    weather["conditions"] = group_weather_conditions(weather)
+    # Few distinct locations: store them as integer category codes,
+    # so cleaning only touches the category labels
+    weather["name"] = weather["name"].astype("category")
+    weather = clean_string_column(weather, "name")
 
     # Group weather data into seasons
     weather = group_seasons(weather)
     return weather
 
-def group_weather_conditions(row):
-    if row["precip"] > 4.0:
-        return "rain"
-    elif row["cloudcover"] > 80:
-        return "overcast"
-    elif row["cloudcover"] < 15 and row["solarradiation"] > 500:
-        return "sunny"
-    elif row["cloudcover"] > 40 or row["humidity"] > 70:
-        return "partially_cloudy"
-    else:
-        return "clear"
-
-def get_season(month):
-    if month in [1, 2, 3]:
-        return "JFM"    # January, February, March season
-    elif month in [4, 5, 6]:
-        return "AMJ"    # April, May, June season
-    elif month in [7, 8, 9]:
-        return "JAS"    # July, August, September season
-    else:
-        return "OND"    # October, November, December season
+def read_weather_csv(file) -> pd.DataFrame:
+    print(f"Loading file {file}")
+    return pd.read_csv(file, index_col="datetime", usecols=WEATHER_COLUMNS,
+                       dtype=WEATHER_DTYPES, parse_dates=["datetime"])
+
+def weather_cache_key(source_files) -> str:
+    """Fingerprints the exact set of source files and their modification times."""
+    stamps = sorted((os.path.basename(file), os.path.getmtime(file)) for file in source_files)
+    return hashlib.md5(str(stamps).encode()).hexdigest()
+
+def read_weather_cache(cache_path, cache_key) -> pd.DataFrame | None:
+    """
+    Returns the cached weather data if cache_path was built from the files
+    fingerprinted by cache_key. An unreadable cache is deleted so it gets rebuilt.
+    """
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+        if metadata.get(WEATHER_CACHE_KEY) != cache_key.encode():
+            return None
+
+        print(f"Loading cached file {cache_path}")
+        return pd.read_parquet(cache_path)
+    except Exception as e:
+        print(f"Error reading cached file {cache_path}; {str(e)}")
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+
+def write_weather_cache(weather, cache_path, cache_key):
+    table = pa.Table.from_pandas(weather)
+    table = table.replace_schema_metadata(
+        {**table.schema.metadata, WEATHER_CACHE_KEY: cache_key.encode()})
+
+    # Write to a temporary file and swap it in, so concurrent loaders (or a
+    # crash mid-write) never leave a partial cache at cache_path
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        pq.write_table(table, temp_path, compression="zstd")
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        print(f"Error caching weather data to {cache_path}; {str(e)}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+def group_weather_conditions(weather):
+    """
+    Classifies every row into a coarse weather condition in one vectorized pass.
+    Conditions are checked in order; the first match wins.
+
+    Args:
+        weather (pd.DataFrame): Weather data with precip, cloudcover,
+                                solarradiation and humidity columns.
+
+    Returns:
+        pd.Categorical: One of rain, overcast, sunny, partially_cloudy or clear per row.
+    """
+    precip = weather["precip"].to_numpy()
+    cloudcover = weather["cloudcover"].to_numpy()
+    solarradiation = weather["solarradiation"].to_numpy()
+    humidity = weather["humidity"].to_numpy()
+
+    conditions = [
+        precip > 4.0,
+        cloudcover > 80,
+        (cloudcover < 15) & (solarradiation > 500),
+        (cloudcover > 40) | (humidity > 70),
+    ]
+    # Select small integer codes rather than strings, then label them once
+    choices = [WEATHER_CONDITIONS.index(label)
+               for label in ("rain", "overcast", "sunny", "partially_cloudy")]
+    codes = np.select(conditions, choices, default=WEATHER_CONDITIONS.index("clear"))
+    return pd.Categorical.from_codes(codes.astype(np.int8), categories=WEATHER_CONDITIONS)
+
+def add_date_columns(weather):
+    """
+    Precomputes calendar columns from the DatetimeIndex once at load time,
+    so request handlers can filter on plain integer/categorical columns instead
+    of re-deriving them (and mutating the shared DataFrame) on every request.
+
+    Args:
+        weather (pd.DataFrame): Weather data indexed by datetime.
+
+    Returns:
+        pd.DataFrame: The DataFrame with year, month, day, week, dayofyear
+        and month_day ("MM-DD") columns.
+    """
+    index = weather.index
+    weather["year"] = index.year.astype("int16")
+    weather["month"] = index.month.astype("int8")
+    weather["day"] = index.day.astype("int8")
+    weather["week"] = index.isocalendar().week.to_numpy().astype("int16")
+    weather["dayofyear"] = index.dayofyear.astype("int16")
+    weather["month_day"] = pd.Categorical(index.strftime("%m-%d"))
+    return weather
 
 def group_seasons(weather):
-    weather["year"] = weather.index.year
-    weather["month"] = weather.index.month
-    weather["season"] = weather["month"].apply(get_season)
+    # One gather from the month number instead of a Python call per row
+    weather["season"] = pd.Categorical(
+        SEASON_BY_MONTH[weather["month"].to_numpy()], categories=SEASONS)
     return weather
 
 def clean_string_column(df, column_name):
@@ -162,12 +313,21 @@ def clean_string_column(df, column_name):
     Returns:
         pd.DataFrame: The DataFrame with the cleaned column.
     """
-    # Ensure the column is of string type to apply string methods
-    column = df[column_name].astype(str)
+    column = df[column_name]
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Labels may merge once cleaned, so map rather than rename categories
+        labels = column.cat.categories
+        df[column_name] = column.map(clean_strings(labels)).astype("category")
+        return df
 
-    column = column.str.replace(' ', '_', regex=True)
-    column = column.str.replace(',', '')
-    column = column.str.lower()
+    # Ensure the column is of string type to apply string methods
+    column = column.astype(str)
+    df[column_name] = column.map(clean_strings(column.unique()))
+    return df
 
-    df[column_name] = column
-    return df
\ No newline at end of file
+def clean_strings(values) -> dict:
+    """Maps each distinct value to its cleaned form in a single pass over the values."""
+    return {
+        value: str(value).replace(' ', '_').replace(',', '').lower()
+        for value in values
+    }
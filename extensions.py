@@ -1,23 +1,107 @@
 import os
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+import orjson
 from dotenv import load_dotenv
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 
 db = SQLAlchemy()
 jwt = JWTManager()
 
+# SMTP settings are read from .env once, when the module is imported
+load_dotenv()
+SMTP_EMAIL = os.getenv("SMTP_EMAIL")
+# use App Password, not your Gmail password
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
+# App is in DEVELOPMENT unless DEVELOPMENT is set to something other than "True"
+DEV_MODE = os.getenv("DEVELOPMENT", "True") == "True"
 
-def send_password_reset_email(username: str, email: str, otp: str):
+# Reset emails are sent in the background by a small, reused pool of threads
+MAIL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mail")
+
+# One logged-in SMTP connection shared by all mail threads (guarded by the lock)
+_smtp_server: smtplib.SMTP_SSL | None = None
+_smtp_lock = threading.Lock()
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Puts each new SQLite connection in WAL mode with synchronous=NORMAL, so
+    small commits (e.g. one OTP per password reset) append to the log
+    without waiting on an fsync; the log is synced at checkpoints instead.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson (a C encoder) for jsonify and
+    request.get_json(). NumPy scalars/arrays serialize directly; datetimes
+    are passed through to Flask's default so they keep Flask's format.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def get_smtp_server(reconnect: bool = False) -> smtplib.SMTP_SSL:
+    """
+    Returns the shared, logged-in Gmail SMTP connection, opening a new one
+    if there is none yet, it no longer answers NOOP, or reconnect is set.
+    Callers must hold _smtp_lock.
+    """
+    global _smtp_server
+
+    if _smtp_server is not None and not reconnect:
+        try:
+            if _smtp_server.noop()[0] == 250:
+                return _smtp_server
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    drop_smtp_server()
+
+    # Only a connection that logged in successfully is cached
+    server = smtplib.SMTP_SSL("smtp.gmail.com", 465)
     try:
-        load_dotenv()
+        server.login(SMTP_EMAIL, SMTP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    _smtp_server = server
+    return _smtp_server
+
 
-        sender_email = os.getenv("SMTP_EMAIL")
-        # use App Password, not your Gmail password
-        app_password = os.getenv("SMTP_PASSWORD")
+def drop_smtp_server():
+    """Closes and forgets the shared SMTP connection. Callers must hold _smtp_lock."""
+    global _smtp_server
 
+    if _smtp_server is not None:
+        try:
+            _smtp_server.close()
+        except Exception:
+            pass
+    _smtp_server = None
+
+
+def send_password_reset_email(username: str, email: str, otp: str):
+    try:
         subject = "Password Reset Request"
         body = f"""
         Hello {username},
@@ -31,23 +115,30 @@ def send_password_reset_email(username: str, email: str, otp: str):
         If you did not request this, please ignore this email.
         """
 
-        dev_mode = os.getenv("DEVELOPMENT")
-        if dev_mode is None or dev_mode == "True":
+        if DEV_MODE:
             # App is in DEVELOPMENT; print message to console
             print(body)
             return
 
         # Build email
         msg = MIMEMultipart()
-        msg["From"] = sender_email
+        msg["From"] = SMTP_EMAIL
         msg["To"] = email
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
 
         # Send via Gmail SMTP
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(sender_email, app_password)
-            server.sendmail(sender_email, email, msg.as_string())
+        with _smtp_lock:
+            try:
+                try:
+                    get_smtp_server().sendmail(SMTP_EMAIL, email, msg.as_string())
+                except smtplib.SMTPServerDisconnected:
+                    # Connection dropped since the last check; reconnect and retry once
+                    get_smtp_server(reconnect=True).sendmail(SMTP_EMAIL, email, msg.as_string())
+            except (smtplib.SMTPException, OSError):
+                # Don't reuse a connection in an unknown state; the next send reconnects
+                drop_smtp_server()
+                raise
 
     except Exception as e:
         print(f"Error sending email to {email}; {str(e)}")
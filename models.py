@@ -1,9 +1,20 @@
-import random
-from werkzeug.security import generate_password_hash, check_password_hash
+import re
+import secrets
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from werkzeug.security import check_password_hash
 
 # My imports
 from extensions import db
 
+# Argon2id with OWASP's baseline cost (19 MiB, 2 passes): roughly a quarter of
+# the CPU time of werkzeug's default scrypt:32768:8:1 (32 MiB) per hash, at a
+# smaller memory cost per guess
+PASSWORD_HASHER = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# local@domain.tld with no whitespace and a single "@"
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[A-Za-z]{2,}")
+
 
 # --- User Model ---
 class User(db.Model):
@@ -15,19 +26,37 @@ class User(db.Model):
     password_hash = db.Column(db.String(200), nullable=False)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = PASSWORD_HASHER.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """
+        Verifies password against the stored hash. On success, hashes made
+        by werkzeug or with outdated argon2 settings are replaced in place;
+        the caller commits the session to save the upgrade.
+        """
+        if not self.password_hash.startswith("$argon2"):
+            # Accounts created before argon2 still hold werkzeug hashes
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.set_password(password)
+            return True
+
+        try:
+            PASSWORD_HASHER.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        if PASSWORD_HASHER.check_needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
 
     @staticmethod
     def validate_email(email):
-        return email.__contains__("@") and email.__contains__(".com")
+        return EMAIL_PATTERN.fullmatch(email) is not None
 
     @staticmethod
     def check_email_exists(email):
         """Check if an email is already in use"""
-        return User.query.filter_by(email=email).first() is not None
+        return db.session.query(User.query.filter_by(email=email).exists()).scalar()
 
     def __repr__(self):
         return f"<User(username={self.username}, email='xxxxxx', password_hash='{self.password_hash}')>"
@@ -35,21 +64,25 @@ class User(db.Model):
 
 class OTP(db.Model):
     __tablename__ = "password_reset_otps"
+    # Covers the reset_password lookup; email leads, so it also serves email-only queries
+    __table_args__ = (
+        db.Index("ix_otp_lookup", "email", "otp", "is_used", "expiry_time"),
+    )
 
     id = db.Column(db.Integer, primary_key=True, index=True)
-    email = db.Column(db.String(100), nullable=False, index=True)
+    email = db.Column(db.String(100), nullable=False)
     otp = db.Column(db.String(5), nullable=False)
     expiry_time = db.Column(db.DateTime(timezone=True), nullable=False)
     is_used = db.Column(db.Boolean, default=False, nullable=False)
 
+    # Joined on email so the existing table needs no new column
+    user = db.relationship(
+        "User", primaryjoin="foreign(OTP.email) == User.email", viewonly=True)
+
     @staticmethod
     def generate_otp(length: int = 6) -> str:
-        otp = ""
-        for _ in range(length):
-            # Generate a random number from 1 - 9 (inclusive)
-            random_number = random.randint(1, 9)
-            otp += f"{random_number}"
-        return otp
+        # Cryptographically random digits from 1 - 9 (inclusive)
+        return "".join(secrets.choice("123456789") for _ in range(length))
 
     def __repr__(self):
         return f"<OTPRecord(email='{self.email}', otp='xxxxx', expiry_time='{self.expiry_time}', is_used='{self.is_used}')>"
@@ -0,0 +1,199 @@
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# My imports
+from data_prep import CROP_THRESHOLDS
+
+# Weather columns get_recommendations averages over, in this order
+REQUIRED_COLUMNS = ['temp', 'precip', 'humidity', 'solarradiation']
+REQUIRED_COLUMN_SET = frozenset(REQUIRED_COLUMNS)
+
+
+def crop_limits(threshold):
+    """
+    Packs the limits get_recommendations compares a crop against into one
+    float array, including the derived irrigation and waterlogging limits.
+
+    Returns:
+        np.ndarray: [min_temp, max_temp, min_precip, max_precip, max_humidity,
+                     irrigation_precip, waterlogging_precip, recent_waterlogging_precip]
+    """
+    return np.array([
+        threshold["min_temp"],
+        threshold["max_temp"],
+        threshold["min_precip"],
+        threshold["max_precip"],
+        threshold["max_humidity"],
+        0.5 * threshold["min_precip"],
+        threshold["max_precip"] * 1.2,
+        threshold["max_precip"] * 0.5,
+    ], dtype=np.float64)
+
+
+# Precomputed once so requests do no per-crop dict lookups or arithmetic
+CROP_LIMITS: dict[str, np.ndarray] = {
+    crop: crop_limits(threshold) for crop, threshold in CROP_THRESHOLDS.items()
+}
+
+
+def window_averages(weather_data):
+    """
+    Averages the REQUIRED_COLUMNS of a weather window in a single reduction
+    over one (rows, 4) array instead of one pandas mean() per column.
+    Like pandas, missing readings are skipped.
+
+    Returns:
+        np.ndarray: [avg_temp, avg_precip, avg_humidity, avg_solar]
+    """
+    values = weather_data[REQUIRED_COLUMNS].to_numpy()
+    return np.nanmean(values, axis=0, dtype=np.float64)
+
+
+class WindowConditions(NamedTuple):
+    """A weather window's averages alongside the limits of the crop being assessed."""
+    avg_temp: float
+    avg_precip: float
+    avg_humidity: float
+    recent_precip: float
+    is_currently_raining: bool
+    # Mirrors the order of crop_limits()
+    min_temp: float
+    max_temp: float
+    min_precip: float
+    max_precip: float
+    max_humidity: float
+    irrigation_precip: float
+    waterlogging_precip: float
+    recent_waterlogging_precip: float
+
+
+Rule = tuple[Callable[[WindowConditions], bool], str]
+
+# Recommendation rules in groups. Within a group only the first rule that
+# applies is used; messages may reference {crop}.
+RECOMMENDATION_RULES: list[list[Rule]] = [
+    # Planting Conditions Recommendations
+    [
+        (lambda w: w.avg_precip > w.max_precip,
+         "High avg rain. Good conditions for planting {crop}."),
+        # Ideal planting conditions
+        (lambda w: w.min_temp <= w.avg_temp <= w.max_temp and w.min_precip <= w.avg_precip <= w.max_precip,
+         "Good conditions for planting {crop}."),
+        (lambda w: w.avg_temp < w.min_temp,
+         "Temp too low. Wait for warmer conditions."),
+        # Rainfall too low, with a nuance for current rain
+        (lambda w: w.avg_precip < w.min_precip and w.is_currently_raining,
+         "Avg rain low, but currently raining. Monitor closely."),
+        (lambda w: w.avg_precip < w.min_precip,
+         "Rainfall too low. Irrigation may be needed."),
+    ],
+    # Irrigation Recommendations
+    # Suggest irrigation if average is very low AND it's not currently raining significantly
+    [
+        (lambda w: w.avg_precip < w.irrigation_precip and not w.is_currently_raining,
+         "Very low avg rain. Apply irrigation."),
+        (lambda w: w.avg_precip < w.irrigation_precip and w.is_currently_raining,
+         "Very low avg rain, but currently raining. Monitor water levels."),
+    ],
+    # Waterlogging Warning
+    [
+        (lambda w: w.avg_precip > w.waterlogging_precip,
+         "Excessive avg rain. High waterlogging risk. Ensure drainage."),
+        # Potential waterlogging if recent rain is high, even if average isn't extremely high
+        (lambda w: w.recent_precip > w.recent_waterlogging_precip,
+         "High recent rain. Potential waterlogging risk. Monitor."),
+    ],
+    # Favorable conditions for fertilizer application, avoiding waterlogged soil and active rain
+    [
+        (lambda w: 10 <= w.avg_temp <= 29 and w.avg_precip < 10
+         and not w.is_currently_raining and w.recent_precip < 5,
+         "Favorable for fertilizer application."),
+        (lambda w: 10 <= w.avg_temp <= 29 and w.avg_precip < 10 and w.is_currently_raining,
+         "Favorable for fertilizer, but currently raining. Apply after rain subsides."),
+    ],
+    # Harvesting Conditions Recommendations
+    [
+        (lambda w: w.avg_precip <= w.min_precip and w.avg_humidity <= w.max_humidity,
+         "Good for harvesting {crop}."),
+    ],
+]
+
+
+def get_recommendations(weather_data, crop):
+    """
+    Generates agricultural recommendations based on weather data for a given crop.
+
+    Args:
+        weather_data (pd.DataFrame): Weather data (temp, precip, humidity, solarradiation)
+                                                for the specified period. This will now typically be
+                                                a wider rolling window (e.g., 21 days).
+        crop (str): The name of the crop for which to get recommendations (e.g., "corn", "wheat").
+
+    Returns:
+        dict: A dictionary containing recommendations or an error message.
+    """
+    if crop not in CROP_THRESHOLDS:
+        return {"msg": f"Unsupported crop '{crop}'"}
+
+    if not isinstance(weather_data, pd.DataFrame):
+        try:
+            weather_data = pd.DataFrame(weather_data)
+        except Exception as e:
+            return {"msg": f"Invalid weather data format: {e}"}
+
+    if not REQUIRED_COLUMN_SET.issubset(weather_data.columns):
+        return {"msg": f"Missing required weather data columns. Need: {', '.join(REQUIRED_COLUMNS)}"}
+
+    avg_temp, avg_precip, avg_humidity, avg_solar = window_averages(weather_data)
+
+    recent_precip = weather_data['precip'].iloc[-1] if not weather_data['precip'].empty else 0
+    window = WindowConditions(
+        avg_temp, avg_precip, avg_humidity, recent_precip, recent_precip > 0.5,
+        *CROP_LIMITS[crop])
+
+    recommendations = []
+    for rules in RECOMMENDATION_RULES:
+        for applies, message in rules:
+            if applies(window):
+                recommendations.append(message.format(crop=crop))
+                break
+
+    if not recommendations:
+        recommendations.append(
+            "No specific recommendations for current conditions.")
+
+    return recommendations
+
+
+# Per-crop bounds for [temp, precip, humidity, solarradiation], one row per crop,
+# so every crop can be checked against every season in one comparison
+CROP_NAMES = list(CROP_THRESHOLDS)
+CROP_MINS = np.array([
+    [t["min_temp"], t["min_precip"], t["min_humidity"], t["min_solarradiation"]]
+    for t in CROP_THRESHOLDS.values()
+], dtype=np.float32)
+CROP_MAXS = np.array([
+    [t["max_temp"], t["max_precip"], t["max_humidity"], t["max_solarradiation"]]
+    for t in CROP_THRESHOLDS.values()
+], dtype=np.float32)
+
+
+def get_crop_suitability(weather_data):
+    """
+    Checks which crops are suitable to grow in certain weather conditions.
+    A crop is suitable if 75% or more parameters are met for any season (row).
+
+    Returns:
+        dict[str, bool]: Suitability of every crop in CROP_THRESHOLDS.
+    """
+    total = 4  # number of parameters being checked
+
+    # (seasons, 1, 4) against (crops, 4) broadcasts to (seasons, crops, 4)
+    values = weather_data[REQUIRED_COLUMNS].to_numpy()[:, np.newaxis, :]
+    in_range = (CROP_MINS <= values) & (values <= CROP_MAXS)
+    score = in_range.sum(axis=2) / total
+
+    suitable = (score >= 0.75).any(axis=0)
+    return dict(zip(CROP_NAMES, suitable.tolist()))
@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers, e.g.
+
+    gunicorn -w $(nproc) --threads 2 --preload wsgi:app
+
+--preload imports the app (and loads the weather data) once in the master
+process, so the read-only DataFrame is shared copy-on-write across workers.
+create_app() empties the database connection pool after setup, so each
+worker opens its own SQLite connections after the fork.
+"""
+from app import app